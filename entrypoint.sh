@@ -45,5 +45,5 @@ if [ "${1:-}" = "init-db" ] || [ "${INITIALIZE_DB:-}" = "1" ]; then
     exit 0
 else
     echo "[WISEFOOD] Starting application server..."
-    exec /bin/sh -c 'uvicorn main:api --host 0.0.0.0 --port ${PORT:-8000}'
+    exec /bin/sh -c 'uvicorn main:api --host 0.0.0.0 --port ${PORT:-8000} --loop uvloop --http httptools --workers ${WORKERS:-$(nproc)}'
 fi
@@ -30,8 +30,10 @@ BEGIN
 END $$;
 
 -- Household & User Profiles
+-- Internal IDs are native uuid (16-byte storage, binary transport);
+-- owner_id stays varchar because it is the external Keycloak user ID.
 CREATE TABLE IF NOT EXISTS wisefood.household (
-    id varchar(64) PRIMARY KEY,
+    id uuid PRIMARY KEY,
     name VARCHAR(255) NOT NULL,
     region VARCHAR(100),
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -43,18 +45,18 @@ CREATE TABLE IF NOT EXISTS wisefood.household (
 
 
 CREATE TABLE IF NOT EXISTS wisefood.household_member (
-    id varchar(64) PRIMARY KEY,
+    id uuid PRIMARY KEY,
     name VARCHAR(255) NOT NULL,
     image_url TEXT,
     age_group age_groups NOT NULL,
-    household_id VARCHAR(100) NOT NULL,
+    household_id uuid NOT NULL,
     joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (household_id) REFERENCES wisefood.household(id) ON DELETE CASCADE ON UPDATE CASCADE
 );
 
 CREATE TABLE IF NOT EXISTS wisefood.household_member_profile (
-    id varchar(64) PRIMARY KEY,
-    household_member_id VARCHAR(100) NOT NULL REFERENCES wisefood.household_member(id) ON DELETE CASCADE ON UPDATE CASCADE,
+    id uuid PRIMARY KEY,
+    household_member_id uuid NOT NULL REFERENCES wisefood.household_member(id) ON DELETE CASCADE ON UPDATE CASCADE,
     nutritional_preferences JSONB DEFAULT '{}',
     dietary_groups dietary_groups[] DEFAULT '{}',
     allergies TEXT[] DEFAULT '{}',
@@ -66,8 +68,8 @@ CREATE TABLE IF NOT EXISTS wisefood.household_member_profile (
 );
 
 CREATE TABLE IF NOT EXISTS wisefood.meal_plan (
-    id VARCHAR(64) PRIMARY KEY,
-    household_id VARCHAR(100) NOT NULL,
+    id uuid PRIMARY KEY,
+    household_id uuid NOT NULL,
     applied_on DATE NOT NULL,
     source_meal_plan_id VARCHAR(100),
     source_created_at TIMESTAMPTZ,
@@ -79,13 +81,12 @@ CREATE TABLE IF NOT EXISTS wisefood.meal_plan (
     FOREIGN KEY (household_id) REFERENCES wisefood.household(id) ON DELETE CASCADE ON UPDATE CASCADE
 );
 
-CREATE INDEX IF NOT EXISTS ix_meal_plan_household_id ON wisefood.meal_plan(household_id);
-CREATE INDEX IF NOT EXISTS ix_meal_plan_applied_on ON wisefood.meal_plan(applied_on);
+CREATE INDEX IF NOT EXISTS ix_meal_plan_household_id_applied_on ON wisefood.meal_plan(household_id, applied_on);
 
 CREATE TABLE IF NOT EXISTS wisefood.meal_plan_member (
-    id VARCHAR(64) PRIMARY KEY,
-    meal_plan_id VARCHAR(64) NOT NULL,
-    member_id VARCHAR(100) NOT NULL,
+    id uuid PRIMARY KEY,
+    meal_plan_id uuid NOT NULL,
+    member_id uuid NOT NULL,
     created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (meal_plan_id) REFERENCES wisefood.meal_plan(id) ON DELETE CASCADE ON UPDATE CASCADE,
     FOREIGN KEY (member_id) REFERENCES wisefood.household_member(id) ON DELETE CASCADE ON UPDATE CASCADE,
@@ -0,0 +1,27 @@
+-- Indexes supporting owner-scoped lookups and keyset pagination.
+
+-- Owner-scoped member lookups filter on (household_id, id); the composite
+-- index lets these resolve with an index-only scan instead of a PK lookup
+-- plus residual filter.
+CREATE INDEX IF NOT EXISTS ix_household_member_household_id_id
+    ON wisefood.household_member (household_id, id);
+
+-- Owner-scoped household access: the composite serves get_by_owner
+-- (owner_id equality plus ORDER BY created_at DESC LIMIT 1) and keyset
+-- pagination over GET /households with a cursor. Its leading column also
+-- covers plain owner_id lookups, so the single-column owner index this
+-- file used to create is redundant write amplification and is dropped.
+CREATE INDEX IF NOT EXISTS ix_household_owner_id_created_at_id
+    ON wisefood.household (owner_id, created_at DESC, id DESC);
+DROP INDEX IF EXISTS wisefood.ix_household_owner_id;
+
+-- household_member_profile(household_member_id) is already unique-indexed
+-- by the UNIQUE constraint in 10_init_schema.sql.
+
+-- Meal-plan lookups filter on household and date together; the composite
+-- index covers both predicates and the household-only prefix, so the two
+-- single-column indexes are redundant write amplification.
+CREATE INDEX IF NOT EXISTS ix_meal_plan_household_id_applied_on
+    ON wisefood.meal_plan (household_id, applied_on);
+DROP INDEX IF EXISTS wisefood.ix_meal_plan_household_id;
+DROP INDEX IF EXISTS wisefood.ix_meal_plan_applied_on;
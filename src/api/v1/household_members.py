@@ -1,7 +1,7 @@
 """
 Household Member Entity implementation with full CRUD operations
 """
-from typing import List, Dict, Any, Optional
+from typing import AsyncGenerator, List, Dict, Any, Optional
 from datetime import datetime, timezone
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,10 +9,24 @@ from sqlalchemy import select, delete
 from uuid import uuid4
 
 from entity import Entity
-from sql import HouseholdMember, HouseholdMemberProfile, Household, AgeGroup, DietaryGroup
+from sql import (
+    HouseholdMember,
+    HouseholdMemberProfile,
+    Household,
+    AgeGroup,
+    coerce_dietary_groups,
+)
 from exceptions import NotFoundError, ConflictError
 from schemas import HouseholdMemberResponse, HouseholdMemberCreate, HouseholdMemberUpdate
 from backend.postgres import POSTGRES_ASYNC_SESSION_FACTORY
+from api.v1.households import HOUSEHOLD
+from utils import is_valid_uuid
+
+
+# Base statement built once at import; per-call clauses are chained on.
+_SELECT_MEMBER_WITH_PROFILE = select(HouseholdMember).options(
+    selectinload(HouseholdMember.profile)
+)
 
 
 class HouseholdMemberEntity(Entity):
@@ -52,10 +66,13 @@ class HouseholdMemberEntity(Entity):
         :param household_id: Filter by household ID
         :return: List of member dictionaries
         """
+        # fetch runs concurrently with the authz check, so a malformed
+        # household_id must be caught here before it reaches the uuid bind.
+        if household_id and not is_valid_uuid(household_id):
+            raise NotFoundError(f"Household {household_id} not found")
+
         async with POSTGRES_ASYNC_SESSION_FACTORY()() as db:
-            query = select(HouseholdMember).options(
-            selectinload(HouseholdMember.profile)
-            )
+            query = _SELECT_MEMBER_WITH_PROFILE
 
             if household_id:
                 query = query.where(HouseholdMember.household_id == household_id)
@@ -72,6 +89,41 @@ class HouseholdMemberEntity(Entity):
 
             return [m.to_dict(include_profile=True) for m in members]
 
+    async def stream(
+        self,
+        household_id: str,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Stream household members one at a time.
+
+        Uses a server-side streamed result (yield_per) so peak memory stays
+        at one batch of rows and the response can start before the full
+        result set is fetched.
+
+        :param household_id: Filter by household ID
+        :param limit: Maximum number of members to yield
+        :param offset: Number of members to skip
+        :return: Async generator of member dictionaries
+        """
+        async with POSTGRES_ASYNC_SESSION_FACTORY()() as db:
+            query = (
+                _SELECT_MEMBER_WITH_PROFILE.where(
+                    HouseholdMember.household_id == household_id
+                )
+                .order_by(HouseholdMember.joined_at.desc())
+                .execution_options(yield_per=100)
+            )
+            if offset:
+                query = query.offset(offset)
+            if limit:
+                query = query.limit(limit)
+
+            result = await db.stream(query)
+            async for member in result.scalars():
+                yield member.to_dict(include_profile=True)
+
     async def list(
         self,
         limit: Optional[int] = None,
@@ -111,9 +163,7 @@ class HouseholdMemberEntity(Entity):
         """
         async with POSTGRES_ASYNC_SESSION_FACTORY()() as db:
             result = await db.execute(
-                select(HouseholdMember)
-                .options(selectinload(HouseholdMember.profile))
-                .where(HouseholdMember.id == entity_id)
+                _SELECT_MEMBER_WITH_PROFILE.where(HouseholdMember.id == entity_id)
             )
             member = result.scalar_one_or_none()
 
@@ -122,6 +172,31 @@ class HouseholdMemberEntity(Entity):
 
             return member.to_dict(include_profile=True)
 
+    async def get_with_household(self, member_id: str) -> tuple:
+        """
+        Get a household member together with its household in one joined query.
+
+        The member-scoped authorization path needs both rows; joining them
+        halves the round trips compared to fetching member then household.
+
+        :param member_id: The member ID
+        :return: Tuple of (member dictionary, household dictionary)
+        """
+        async with POSTGRES_ASYNC_SESSION_FACTORY()() as db:
+            result = await db.execute(
+                select(HouseholdMember, Household)
+                .join(Household, HouseholdMember.household_id == Household.id)
+                .options(selectinload(HouseholdMember.profile))
+                .where(HouseholdMember.id == member_id)
+            )
+            row = result.first()
+
+            if not row:
+                raise NotFoundError(f"Household member {member_id} not found")
+
+            member, household = row
+            return member.to_dict(include_profile=True), household.to_dict()
+
     async def create(
         self,
         spec: Dict[str, Any],
@@ -140,7 +215,7 @@ class HouseholdMemberEntity(Entity):
         if not household_id:
             raise ConflictError("household_id is required to create a member")
 
-        async with POSTGRES_ASYNC_SESSION_FACTORY()() as db:
+        async with POSTGRES_ASYNC_SESSION_FACTORY().begin() as db:
             # Verify household exists
             result = await db.execute(
                 select(Household).where(Household.id == household_id)
@@ -172,15 +247,97 @@ class HouseholdMemberEntity(Entity):
             if profile_data:
                 await self._create_member_profile_in_session(db, member_id, profile_data)
 
-            await db.commit()
-
             result = await db.execute(
-                select(HouseholdMember)
-                .options(selectinload(HouseholdMember.profile))
-                .where(HouseholdMember.id == member_id)
+                _SELECT_MEMBER_WITH_PROFILE.where(HouseholdMember.id == member_id)
             )
             member = result.scalar_one()
-            return member.to_dict(include_profile=True)
+            member_dict = member.to_dict(include_profile=True)
+            owner_id = household.owner_id
+
+        # The owner's cached /households/me payload embeds the member list,
+        # so member mutations must drop it after commit or reads stay stale
+        # for the cache TTL.
+        HOUSEHOLD._owner_cache_invalidate(owner_id)
+        return member_dict
+
+    async def create_bulk(
+        self,
+        household_id: str,
+        specs: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several household members in a single transaction.
+
+        Amortizes the household check, the inserts, and the commit across
+        all rows instead of paying one round trip per member.
+
+        :param household_id: The household the members belong to
+        :param specs: List of member creation data
+        :return: List of created member dictionaries, in input order
+        """
+        if not specs:
+            return []
+
+        async with POSTGRES_ASYNC_SESSION_FACTORY().begin() as db:
+            # Verify household exists once for the whole batch
+            result = await db.execute(
+                select(Household).where(Household.id == household_id)
+            )
+            household = result.scalar_one_or_none()
+            if not household:
+                raise NotFoundError(f"Household {household_id} not found")
+
+            members = []
+            profiles = []
+            for spec in specs:
+                member_id = str(uuid4())
+                age_group_value = spec.get("age_group")
+                if isinstance(age_group_value, str):
+                    age_group = AgeGroup(age_group_value)
+                else:
+                    age_group = age_group_value
+
+                members.append(
+                    HouseholdMember(
+                        id=member_id,
+                        name=spec["name"],
+                        image_url=spec.get("image_url"),
+                        age_group=age_group,
+                        household_id=household_id,
+                    )
+                )
+
+                profile_data = spec.get("profile")
+                if profile_data:
+                    dietary_groups = coerce_dietary_groups(
+                        profile_data.get("dietary_groups", [])
+                    )
+                    profiles.append(
+                        HouseholdMemberProfile(
+                            id=str(uuid4()),
+                            household_member_id=member_id,
+                            nutritional_preferences=profile_data.get("nutritional_preferences", {}),
+                            dietary_groups=dietary_groups,
+                            allergies=profile_data.get("allergies", []),
+                        )
+                    )
+
+            db.add_all(members)
+            await db.flush()
+            if profiles:
+                db.add_all(profiles)
+                await db.flush()
+
+            member_ids = [m.id for m in members]
+            result = await db.execute(
+                _SELECT_MEMBER_WITH_PROFILE.where(HouseholdMember.id.in_(member_ids))
+            )
+            by_id = {m.id: m for m in result.scalars().all()}
+            member_dicts = [by_id[mid].to_dict(include_profile=True) for mid in member_ids]
+            owner_id = household.owner_id
+
+        HOUSEHOLD._owner_cache_invalidate(owner_id)
+        return member_dicts
 
     async def patch(
         self,
@@ -194,17 +351,22 @@ class HouseholdMemberEntity(Entity):
         :param spec: Update data
         :return: Updated member dictionary
         """
-        async with POSTGRES_ASYNC_SESSION_FACTORY()() as db:
+        async with POSTGRES_ASYNC_SESSION_FACTORY().begin() as db:
+            # Join the owner in so the post-commit owner-cache invalidation
+            # doesn't cost a second lookup.
             result = await db.execute(
-                select(HouseholdMember)
+                select(HouseholdMember, Household.owner_id)
+                .join(Household, HouseholdMember.household_id == Household.id)
                 .options(selectinload(HouseholdMember.profile))
                 .where(HouseholdMember.id == entity_id)
             )
-            member = result.scalar_one_or_none()
+            row = result.first()
 
-            if not member:
+            if not row:
                 raise NotFoundError(f"Household member {entity_id} not found")
 
+            member, owner_id = row
+
             if "name" in spec and spec["name"] is not None:
                 member.name = spec["name"]
             if "age_group" in spec and spec["age_group"] is not None:
@@ -223,8 +385,10 @@ class HouseholdMemberEntity(Entity):
                 )
 
             await db.flush()
-            await db.commit()
-            return member.to_dict(include_profile=True)
+            member_dict = member.to_dict(include_profile=True)
+
+        HOUSEHOLD._owner_cache_invalidate(owner_id)
+        return member_dict
 
     async def delete(
         self,
@@ -236,12 +400,18 @@ class HouseholdMemberEntity(Entity):
         :param entity_id: The member ID
         :return: True if deleted
         """
-        async with POSTGRES_ASYNC_SESSION_FACTORY()() as db:
+        async with POSTGRES_ASYNC_SESSION_FACTORY().begin() as db:
+            # Multi-table delete returns the owner for the cache drop.
             result = await db.execute(
-                delete(HouseholdMember).where(HouseholdMember.id == entity_id)
+                delete(HouseholdMember)
+                .where(HouseholdMember.id == entity_id)
+                .where(HouseholdMember.household_id == Household.id)
+                .returning(Household.owner_id)
             )
-            await db.commit()
-            return result.rowcount > 0
+            owner_id = result.scalar_one_or_none()
+
+        HOUSEHOLD._owner_cache_invalidate(owner_id)
+        return owner_id is not None
 
     async def search(
         self,
@@ -284,14 +454,9 @@ class HouseholdMemberEntity(Entity):
             if "nutritional_preferences" in profile_data:
                 existing_profile.nutritional_preferences = profile_data["nutritional_preferences"]
             if "dietary_groups" in profile_data:
-                dietary_groups = profile_data["dietary_groups"]
-                if dietary_groups:
-                    existing_profile.dietary_groups = [
-                        DietaryGroup(dg) if isinstance(dg, str) else dg
-                        for dg in dietary_groups
-                    ]
-                else:
-                    existing_profile.dietary_groups = []
+                existing_profile.dietary_groups = coerce_dietary_groups(
+                    profile_data["dietary_groups"]
+                )
             if "allergies" in profile_data:
                 existing_profile.allergies = profile_data.get("allergies") or []
             existing_profile.updated_at = datetime.now(timezone.utc)
@@ -300,12 +465,7 @@ class HouseholdMemberEntity(Entity):
 
         # Create new profile
         profile_id = str(uuid4())
-        dietary_groups = profile_data.get("dietary_groups", [])
-        if dietary_groups:
-            dietary_groups = [
-                DietaryGroup(dg) if isinstance(dg, str) else dg
-                for dg in dietary_groups
-            ]
+        dietary_groups = coerce_dietary_groups(profile_data.get("dietary_groups", []))
 
         profile = HouseholdMemberProfile(
             id=profile_id,
@@ -330,18 +490,24 @@ class HouseholdMemberEntity(Entity):
         :param profile_data: Profile data
         :return: Created/updated profile dictionary
         """
-        async with POSTGRES_ASYNC_SESSION_FACTORY()() as db:
-            # Verify member exists
+        async with POSTGRES_ASYNC_SESSION_FACTORY().begin() as db:
+            # Verify member exists and pick up the owner for the cache drop
             result = await db.execute(
-                select(HouseholdMember).where(HouseholdMember.id == member_id)
+                select(HouseholdMember.id, Household.owner_id)
+                .join(Household, HouseholdMember.household_id == Household.id)
+                .where(HouseholdMember.id == member_id)
             )
-            member = result.scalar_one_or_none()
-            if not member:
+            row = result.first()
+            if not row:
                 raise NotFoundError(f"Household member {member_id} not found")
+            owner_id = row.owner_id
 
-            profile_dict = await self._create_member_profile_in_session(db, member_id, profile_data)
-            await db.commit()
-            return profile_dict
+            profile_dict = await self._create_member_profile_in_session(
+                db, member_id, profile_data
+            )
+
+        HOUSEHOLD._owner_cache_invalidate(owner_id)
+        return profile_dict
 
     async def get_member_profile(
         self,
@@ -365,6 +531,44 @@ class HouseholdMemberEntity(Entity):
                 return profile.to_dict()
             return None
 
+    async def get_profile_with_owner(
+        self,
+        member_id: str,
+    ) -> tuple:
+        """
+        Get a member's profile together with the owning household's owner ID
+        in a single joined query.
+
+        Replaces the member-fetch + household-fetch + profile-fetch sequence
+        used for authorization with one round trip.
+
+        :param member_id: The member ID
+        :return: Tuple of (profile dictionary or None, household owner ID)
+        """
+        # Called straight from the profile endpoint with the raw path param,
+        # so the uuid-shape check happens here rather than in an authz layer.
+        if not is_valid_uuid(member_id):
+            raise NotFoundError(f"Household member {member_id} not found")
+
+        async with POSTGRES_ASYNC_SESSION_FACTORY()() as db:
+            result = await db.execute(
+                select(HouseholdMemberProfile, Household.owner_id)
+                .select_from(HouseholdMember)
+                .join(Household, HouseholdMember.household_id == Household.id)
+                .outerjoin(
+                    HouseholdMemberProfile,
+                    HouseholdMemberProfile.household_member_id == HouseholdMember.id,
+                )
+                .where(HouseholdMember.id == member_id)
+            )
+            row = result.first()
+
+            if not row:
+                raise NotFoundError(f"Household member {member_id} not found")
+
+            profile, owner_id = row
+            return (profile.to_dict() if profile else None, owner_id)
+
     async def update_member_profile(
         self,
         member_id: str,
@@ -377,28 +581,29 @@ class HouseholdMemberEntity(Entity):
         :param profile_data: Profile update data
         :return: Updated profile dictionary
         """
-        async with POSTGRES_ASYNC_SESSION_FACTORY()() as db:
+        async with POSTGRES_ASYNC_SESSION_FACTORY().begin() as db:
             result = await db.execute(
-                select(HouseholdMemberProfile).where(
-                    HouseholdMemberProfile.household_member_id == member_id
+                select(HouseholdMemberProfile, Household.owner_id)
+                .join(
+                    HouseholdMember,
+                    HouseholdMemberProfile.household_member_id == HouseholdMember.id,
                 )
+                .join(Household, HouseholdMember.household_id == Household.id)
+                .where(HouseholdMemberProfile.household_member_id == member_id)
             )
-            profile = result.scalar_one_or_none()
+            row = result.first()
 
-            if not profile:
+            if not row:
                 raise NotFoundError(f"Profile for household member {member_id} not found")
 
+            profile, owner_id = row
+
             if "nutritional_preferences" in profile_data:
                 profile.nutritional_preferences = profile_data["nutritional_preferences"]
             if "dietary_groups" in profile_data:
-                dietary_groups = profile_data["dietary_groups"]
-                if dietary_groups:
-                    profile.dietary_groups = [
-                        DietaryGroup(dg) if isinstance(dg, str) else dg
-                        for dg in dietary_groups
-                    ]
-                else:
-                    profile.dietary_groups = []
+                profile.dietary_groups = coerce_dietary_groups(
+                    profile_data["dietary_groups"]
+                )
             if "allergies" in profile_data:
                 profile.allergies = profile_data.get("allergies") or []
             if "properties" in profile_data:
@@ -406,8 +611,10 @@ class HouseholdMemberEntity(Entity):
 
             profile.updated_at = datetime.now(timezone.utc)
             await db.flush()
-            await db.commit()
-            return profile.to_dict()
+            profile_dict = profile.to_dict()
+
+        HOUSEHOLD._owner_cache_invalidate(owner_id)
+        return profile_dict
 
     async def delete_member_profile(
         self,
@@ -419,14 +626,19 @@ class HouseholdMemberEntity(Entity):
         :param member_id: The member ID
         :return: True if deleted
         """
-        async with POSTGRES_ASYNC_SESSION_FACTORY()() as db:
+        async with POSTGRES_ASYNC_SESSION_FACTORY().begin() as db:
+            # Multi-table delete returns the owner for the cache drop.
             result = await db.execute(
-                delete(HouseholdMemberProfile).where(
-                    HouseholdMemberProfile.household_member_id == member_id
-                )
+                delete(HouseholdMemberProfile)
+                .where(HouseholdMemberProfile.household_member_id == member_id)
+                .where(HouseholdMemberProfile.household_member_id == HouseholdMember.id)
+                .where(HouseholdMember.household_id == Household.id)
+                .returning(Household.owner_id)
             )
-            await db.commit()
-            return result.rowcount > 0
+            owner_id = result.scalar_one_or_none()
+
+        HOUSEHOLD._owner_cache_invalidate(owner_id)
+        return owner_id is not None
 
 
 # Singleton instance
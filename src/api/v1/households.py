@@ -1,18 +1,41 @@
 """
 Household Entity implementation with full CRUD operations
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timezone
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, tuple_
 from uuid import uuid4
 
 from entity import Entity
-from sql import Household, HouseholdMember, HouseholdMemberProfile, AgeGroup, DietaryGroup
+from sql import (
+    Household,
+    HouseholdMember,
+    HouseholdMemberProfile,
+    AgeGroup,
+    coerce_dietary_groups,
+)
 from exceptions import NotFoundError, ConflictError
 from schemas import HouseholdResponse, HouseholdCreate, HouseholdUpdate
 from backend.postgres import POSTGRES_ASYNC_SESSION_FACTORY
+from backend.redis import REDIS
+from main import config
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Base statements built once at import; per-call clauses are chained on,
+# so the option/column construction cost is not paid per request.
+_SELECT_HOUSEHOLD_WITH_MEMBERS = select(Household).options(
+    selectinload(Household.members).selectinload(HouseholdMember.profile)
+)
+
+# get_by_owner resolves essentially the same row on every app load, so it
+# gets a short-lived cache keyed by the owner's Keycloak sub.
+_OWNER_CACHE_PREFIX = "household:owner:"
+_OWNER_CACHE_TTL = 300  # seconds
 
 
 class HouseholdEntity(Entity):
@@ -35,6 +58,34 @@ class HouseholdEntity(Entity):
             update_schema=HouseholdUpdate,
         )
 
+    # ========== Owner cache helpers ==========
+
+    def _owner_cache_get(self, owner_id: str) -> Optional[Dict[str, Any]]:
+        """Get the cached household for an owner, or None on miss/error."""
+        if not config.settings.get("CACHE_ENABLED", False):
+            return None
+        try:
+            return REDIS.get(_OWNER_CACHE_PREFIX + owner_id)
+        except Exception as e:
+            logger.error(f"Failed to read owner cache for {owner_id}: {e}")
+            return None
+
+    def _owner_cache_set(self, owner_id: str, household: Dict[str, Any]) -> None:
+        """Cache the household dict for an owner with a short TTL."""
+        if config.settings.get("CACHE_ENABLED", False):
+            try:
+                REDIS.set(_OWNER_CACHE_PREFIX + owner_id, household, ttl=_OWNER_CACHE_TTL)
+            except Exception as e:
+                logger.error(f"Failed to cache household for owner {owner_id}: {e}")
+
+    def _owner_cache_invalidate(self, owner_id: Optional[str]) -> None:
+        """Drop the cached household for an owner after a mutation."""
+        if owner_id and config.settings.get("CACHE_ENABLED", False):
+            try:
+                REDIS.delete(_OWNER_CACHE_PREFIX + owner_id)
+            except Exception as e:
+                logger.error(f"Failed to invalidate owner cache for {owner_id}: {e}")
+
     # ========== Household Operations ==========
 
     async def fetch(
@@ -42,23 +93,38 @@ class HouseholdEntity(Entity):
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         owner_id: Optional[str] = None,
+        cursor: Optional[Tuple[datetime, str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Fetch a list of households.
 
         :param limit: Maximum number of households to return
-        :param offset: Number of households to skip
+        :param offset: Number of households to skip (legacy; prefer cursor)
         :param owner_id: Filter by owner ID
+        :param cursor: Keyset cursor (created_at, id) of the last row of the
+            previous page; rows strictly before it are returned
         :return: List of household dictionaries
         """
         async with POSTGRES_ASYNC_SESSION_FACTORY()() as db:
-            query = select(Household)
+            # Full load profile: members and their profiles arrive in two
+            # batched selectin queries regardless of page size, and the
+            # returned dicts carry a real member_count (the bare select
+            # reported 0 for every row).
+            query = _SELECT_HOUSEHOLD_WITH_MEMBERS
             if owner_id:
                 query = query.where(Household.owner_id == owner_id)
-            
-            query = query.order_by(Household.created_at.desc())
-            
-            if offset:
+
+            # Keyset pagination: O(limit) per page regardless of depth,
+            # unlike OFFSET which scans and discards skipped rows.
+            if cursor:
+                cursor_ts, cursor_id = cursor
+                query = query.where(
+                    tuple_(Household.created_at, Household.id) < (cursor_ts, cursor_id)
+                )
+
+            query = query.order_by(Household.created_at.desc(), Household.id.desc())
+
+            if offset and not cursor:
                 query = query.offset(offset)
             if limit:
                 query = query.limit(limit)
@@ -66,7 +132,7 @@ class HouseholdEntity(Entity):
             result = await db.execute(query)
             households = list(result.scalars().all())
 
-            return [h.to_dict() for h in households]
+            return [h.to_dict(include_members=True) for h in households]
 
     async def list(
         self,
@@ -106,11 +172,7 @@ class HouseholdEntity(Entity):
         """
         async with POSTGRES_ASYNC_SESSION_FACTORY()() as db:
             result = await db.execute(
-                select(Household)
-                .options(
-                    selectinload(Household.members).selectinload(HouseholdMember.profile)
-                )
-                .where(Household.id == entity_id)
+                _SELECT_HOUSEHOLD_WITH_MEMBERS.where(Household.id == entity_id)
             )
             household = result.scalar_one_or_none()
 
@@ -126,20 +188,22 @@ class HouseholdEntity(Entity):
         :param owner_id: The owner's user ID
         :return: Household dictionary or None
         """
+        cached = self._owner_cache_get(owner_id)
+        if cached is not None:
+            return cached
+
         async with POSTGRES_ASYNC_SESSION_FACTORY()() as db:
             result = await db.execute(
-                select(Household)
-                .options(
-                    selectinload(Household.members).selectinload(HouseholdMember.profile)
-                )
-                .where(Household.owner_id == owner_id)
+                _SELECT_HOUSEHOLD_WITH_MEMBERS.where(Household.owner_id == owner_id)
                 .order_by(Household.created_at.desc())
                 .limit(1)
             )
             household = result.scalar_one_or_none()
 
             if household:
-                return household.to_dict(include_members=True)
+                household_dict = household.to_dict(include_members=True)
+                self._owner_cache_set(owner_id, household_dict)
+                return household_dict
             return None
 
     async def create(
@@ -183,13 +247,10 @@ class HouseholdEntity(Entity):
 
             await db.commit()
             result = await db.execute(
-                select(Household)
-                .options(
-                    selectinload(Household.members).selectinload(HouseholdMember.profile)
-                )
-                .where(Household.id == household_id)
+                _SELECT_HOUSEHOLD_WITH_MEMBERS.where(Household.id == household_id)
             )
             household = result.scalar_one()
+            self._owner_cache_invalidate(owner_id)
             return household.to_dict(include_members=True)
 
     async def patch(
@@ -224,6 +285,7 @@ class HouseholdEntity(Entity):
             await db.flush()
             await db.commit()
 
+            self._owner_cache_invalidate(household.owner_id)
             return household.to_dict(include_members=True)
 
     async def delete(
@@ -238,10 +300,14 @@ class HouseholdEntity(Entity):
         """
         async with POSTGRES_ASYNC_SESSION_FACTORY()() as db:
             result = await db.execute(
-                delete(Household).where(Household.id == entity_id)
+                delete(Household)
+                .where(Household.id == entity_id)
+                .returning(Household.owner_id)
             )
+            owner_id = result.scalar_one_or_none()
             await db.commit()
-            return result.rowcount > 0
+            self._owner_cache_invalidate(owner_id)
+            return owner_id is not None
 
     async def search(
         self,
@@ -296,12 +362,9 @@ class HouseholdEntity(Entity):
         if profile_data:
             # Create profile inline
             profile_id = str(uuid4())
-            dietary_groups = profile_data.get("dietary_groups", [])
-            if dietary_groups:
-                dietary_groups = [
-                    DietaryGroup(dg) if isinstance(dg, str) else dg
-                    for dg in dietary_groups
-                ]
+            dietary_groups = coerce_dietary_groups(
+                profile_data.get("dietary_groups", [])
+            )
 
             profile = HouseholdMemberProfile(
                 id=profile_id,
@@ -13,6 +13,7 @@ from sqlalchemy.orm import selectinload
 from backend.postgres import POSTGRES_ASYNC_SESSION_FACTORY
 from exceptions import ConflictError, DataError, NotFoundError
 from sql import HouseholdMember, MealPlan, MealPlanMember
+from utils import is_valid_uuid
 
 
 class MealPlanEntity:
@@ -53,6 +54,15 @@ class MealPlanEntity:
         self,
         member_ids: List[str],
     ) -> List[HouseholdMember]:
+        # Body-supplied IDs go into a uuid IN(); malformed ones can never
+        # match a row, so report them as missing instead of letting the
+        # driver's bind codec blow up.
+        malformed = sorted(m for m in set(member_ids) if not is_valid_uuid(m))
+        if malformed:
+            raise NotFoundError(
+                detail=f"Members not found: {', '.join(malformed)}"
+            )
+
         async with POSTGRES_ASYNC_SESSION_FACTORY()() as db:
             result = await db.execute(
                 select(HouseholdMember).where(HouseholdMember.id.in_(member_ids))
@@ -81,6 +91,7 @@ class MealPlanEntity:
         target_date: date,
         meal_plan_spec: Dict[str, Any],
         additional_member_ids: List[str],
+        requested_member_household_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         if target_date < date.today():
             raise DataError(
@@ -90,9 +101,15 @@ class MealPlanEntity:
                 )
             )
 
-        target_member_ids = sorted(set([requested_member_id, *additional_member_ids]))
-        members = await self._get_members_in_same_household(target_member_ids)
-        household_id = members[0].household_id
+        target_member_ids = sorted({requested_member_id, *additional_member_ids})
+        if requested_member_household_id is not None and not additional_member_ids:
+            # Caller (the authz dependency) already resolved the requested
+            # member's household; with no additional members to cross-check
+            # the batch lookup would be redundant.
+            household_id = requested_member_household_id
+        else:
+            members = await self._get_members_in_same_household(target_member_ids)
+            household_id = members[0].household_id
 
         incoming_source_meal_plan_id = meal_plan_spec.get("id")
         incoming_breakfast = meal_plan_spec["breakfast"]
@@ -155,15 +172,15 @@ class MealPlanEntity:
             )
 
             if reusable_plan_id:
-                for member_id in members_without_assignments:
-                    db.add(
+                if members_without_assignments:
+                    db.add_all(
                         MealPlanMember(
                             id=str(uuid4()),
                             meal_plan_id=reusable_plan_id,
                             member_id=member_id,
                         )
+                        for member_id in members_without_assignments
                     )
-                if members_without_assignments:
                     await db.commit()
             else:
                 plan = MealPlan(
@@ -181,14 +198,14 @@ class MealPlanEntity:
                 await db.flush()
                 reusable_plan_id = plan.id
 
-                for member_id in target_member_ids:
-                    db.add(
-                        MealPlanMember(
-                            id=str(uuid4()),
-                            meal_plan_id=reusable_plan_id,
-                            member_id=member_id,
-                        )
+                db.add_all(
+                    MealPlanMember(
+                        id=str(uuid4()),
+                        meal_plan_id=reusable_plan_id,
+                        member_id=member_id,
                     )
+                    for member_id in target_member_ids
+                )
 
                 await db.commit()
 
@@ -209,6 +226,11 @@ class MealPlanEntity:
         member_id: str,
         target_date: date,
     ) -> Dict[str, Any]:
+        # Runs concurrently with the authz check, so a malformed member_id
+        # must be caught here before it reaches the uuid bind.
+        if not is_valid_uuid(member_id):
+            raise NotFoundError(detail=f"Household member {member_id} not found")
+
         async with POSTGRES_ASYNC_SESSION_FACTORY()() as db:
             result = await db.execute(
                 select(MealPlan)
@@ -239,14 +261,22 @@ class MealPlanEntity:
         member_id: str,
         meal_plan_id: str,
         revoke_for_all_members: bool = False,
+        member_household_id: Optional[str] = None,
     ) -> Dict[str, Any]:
+        # meal_plan_id arrives as a raw path param (authz only covers the
+        # member), so reject malformed values before the uuid bind.
+        if not is_valid_uuid(meal_plan_id):
+            raise NotFoundError(detail=f"Meal plan {meal_plan_id} not found")
+
         async with POSTGRES_ASYNC_SESSION_FACTORY()() as db:
-            member_result = await db.execute(
-                select(HouseholdMember).where(HouseholdMember.id == member_id)
-            )
-            member = member_result.scalar_one_or_none()
-            if not member:
-                raise NotFoundError(detail=f"Household member {member_id} not found")
+            if member_household_id is None:
+                member_result = await db.execute(
+                    select(HouseholdMember).where(HouseholdMember.id == member_id)
+                )
+                member = member_result.scalar_one_or_none()
+                if not member:
+                    raise NotFoundError(detail=f"Household member {member_id} not found")
+                member_household_id = member.household_id
 
             plan_result = await db.execute(
                 select(MealPlan)
@@ -257,7 +287,7 @@ class MealPlanEntity:
             if not meal_plan:
                 raise NotFoundError(detail=f"Meal plan {meal_plan_id} not found")
 
-            if meal_plan.household_id != member.household_id:
+            if meal_plan.household_id != member_household_id:
                 raise NotFoundError(
                     detail=f"Meal plan {meal_plan_id} not found for member {member_id}"
                 )
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 import time
 import urllib.parse
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, Callable
 
 import httpx
@@ -216,15 +217,20 @@ async def _introspect_active(token: str) -> None:
 
 
 # ---------------- Unified dependency ----------------
-def auth(
-    permissions: Optional[Union[str, Iterable[str]]] = None,
-    *,
-    match: str = "any",  # "any" or "all"
-    mode: str = "local",  # "local" | "introspect" | "both"
+@lru_cache(maxsize=None)
+def _auth_dependency(
+    required: Tuple[str, ...],
+    match: str,
+    mode: str,
 ) -> Callable[..., Dict[str, Any]]:
-    required = _parse_permissions(permissions)
-    match = (match or "any").lower()
-    mode = (mode or "local").lower()
+    """
+    Build (and memoize) the dependency closure for a permission spec.
+
+    Returning the same callable for the same spec lets FastAPI's
+    per-request dependency cache run token verification once per request
+    even when several routes and sub-dependencies declare auth() with
+    identical arguments.
+    """
 
     async def dependency(
         token: str = Depends(get_current_token),
@@ -245,11 +251,36 @@ def auth(
 
         if required:
             roles = _extract_roles(payload)
-            if not _check_permissions(roles, required, match):
+            if not _check_permissions(roles, list(required), match):
                 raise AuthorizationError(
                     detail="Insufficient permissions",
-                    extra={"required": required, "match": match, "roles": roles},
+                    extra={"required": list(required), "match": match, "roles": roles},
                 )
         return payload
 
-    return dependency
\ No newline at end of file
+    return dependency
+
+
+def auth(
+    permissions: Optional[Union[str, Iterable[str]]] = None,
+    *,
+    match: str = "any",  # "any" or "all"
+    mode: str = "local",  # "local" | "introspect" | "both"
+) -> Callable[..., Dict[str, Any]]:
+    return _auth_dependency(
+        tuple(_parse_permissions(permissions)),
+        (match or "any").lower(),
+        (mode or "local").lower(),
+    )
+
+
+async def current_user_id(payload: Dict[str, Any] = Depends(auth())) -> str:
+    """
+    Dependency resolving the caller's user ID (Keycloak `sub`) from the
+    already-verified token payload.
+
+    Cheaper than kutils.current_user(request), which performs an extra
+    Keycloak lookup per call; FastAPI dedupes the shared auth() dependency
+    across the request tree.
+    """
+    return payload["sub"]
\ No newline at end of file
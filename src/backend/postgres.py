@@ -108,13 +108,31 @@ class PostgresConnectionSingleton:
         database_url = cls._get_database_url(async_driver=True)
         pool_size = int(config.settings.get("POSTGRES_POOL_SIZE", 10))
         max_overflow = int(config.settings.get("POSTGRES_MAX_OVERFLOW", 20))
+        stmt_cache_size = int(config.settings.get("POSTGRES_STMT_CACHE_SIZE", 256))
+        pool_recycle = int(config.settings.get("POSTGRES_POOL_RECYCLE", 1800))
+        # Recycling connections makes the per-checkout liveness ping
+        # redundant in the common case; re-enable it via env when the
+        # network between app and database is known to drop idle links.
+        pool_pre_ping = str(
+            config.settings.get("POSTGRES_POOL_PRE_PING", "false")
+        ).lower() in {"true", "1", "yes"}
 
         cls._async_engine = create_async_engine(
             database_url,
             echo=config.settings.get("DEBUG", False),
-            pool_pre_ping=True,
+            pool_pre_ping=pool_pre_ping,
             pool_size=pool_size,
             max_overflow=max_overflow,
+            pool_recycle=pool_recycle,
+            connect_args={
+                # asyncpg caches prepared statements per connection, skipping
+                # the per-call PREPARE round trip. Set to 0 behind PgBouncer
+                # transaction pooling.
+                "prepared_statement_cache_size": stmt_cache_size,
+                # This workload is small point selects/inserts; PG's JIT
+                # only adds per-query compile overhead at that shape.
+                "server_settings": {"jit": "off"},
+            },
         )
 
     @classmethod
@@ -130,6 +148,7 @@ class PostgresConnectionSingleton:
             pool_pre_ping=True,
             pool_size=pool_size,
             max_overflow=max_overflow,
+            pool_recycle=int(config.settings.get("POSTGRES_POOL_RECYCLE", 1800)),
         )
 
     @classmethod
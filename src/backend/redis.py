@@ -6,6 +6,7 @@ from exceptions import (
 )
 import logging
 import json
+import orjson
 import time
 
 logger = logging.getLogger(__name__)
@@ -26,16 +27,21 @@ class RedisClient:
         logging.info("Initialized Redis connection pool")
         return cls._pool
 
-    def set(self, key, value):
-        """Set a value in Redis using a connection from the pool."""
+    def set(self, key, value, ttl=None):
+        """Set a value in Redis using a connection from the pool.
+
+        :param ttl: Optional expiry in seconds.
+        """
         try:
             if self._pool is None:
                 self._initialize_redis()
             conn = redis.Redis(connection_pool=self._pool)
             if isinstance(value, dict):
-                conn.set(key, json.dumps(value))  # Serialize dict to JSON string
+                # orjson handles datetime/date values natively, so entity
+                # dicts can carry them without pre-rendering ISO strings.
+                conn.set(key, orjson.dumps(value), ex=ttl)
             else:
-                conn.set(key, value)
+                conn.set(key, value, ex=ttl)
         except Exception as e:
             raise BadGatewayError(e)
 
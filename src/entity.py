@@ -87,6 +87,13 @@ class Entity:
         if update_schema is None:
             self.operations.remove("patch")
 
+        # Field names of the dump schema, precomputed so the cached-get
+        # paths can project entity dicts onto the public shape without a
+        # Pydantic validate/dump round trip per request.
+        self._dump_fields = (
+            tuple(dump_schema.model_fields) if dump_schema is not None else None
+        )
+
     def fetch_entities(
         self, limit: Optional[int] = None, offset: Optional[int] = None
     ) -> List[Dict[str, Any]]:
@@ -172,13 +179,16 @@ class Entity:
         """
         Get the ID of an entity given its ID or UUID.
 
+        Entity primary keys are native uuid columns, so a malformed ID
+        is rejected here with a clean 404; letting it through would blow
+        up in the driver's uuid bind codec as a 500 instead.
+
         :param identifier: The ID or UUID of the entity.
         :return: The ID of the entity.
         """
         if is_valid_uuid(identifier):
             return identifier
-        else:
-            return identifier
+        raise NotFoundError(f"{self.name} {identifier} not found")
 
     def cache(self, entity_id: str, obj) -> None:
         """
@@ -221,6 +231,20 @@ class Entity:
         except Exception as e:
             raise NotFoundError(f"Failed to resolve ID for UUID {uuid}: {e}")
 
+    def _project_dump(self, obj: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Project a trusted entity dict onto the dump-schema fields.
+
+        get() implementations may emit more than the public contract (the
+        household get() includes the full members list for its internal
+        callers); keeping only the dump-schema keys preserves the response
+        shape the old validate/dump round trip produced, at the cost of one
+        dict build instead of a full Pydantic pass.
+        """
+        if self._dump_fields is None:
+            return obj
+        return {key: obj.get(key) for key in self._dump_fields}
+
     def get_cached(self, entity_id: str) -> Optional[Dict[str, Any]]:
         obj = None
         if config.settings.get("CACHE_ENABLED", False):
@@ -233,7 +257,10 @@ class Entity:
             obj = self.get(entity_id)
             self.cache(entity_id, obj)
 
-        return self.dump_schema.model_validate(obj).model_dump(mode="json")
+        # The dict comes from our own get() or from a cache entry we wrote,
+        # so its values are trusted; only the key set needs narrowing to the
+        # public dump-schema shape.
+        return self._project_dump(obj)
 
     def get_entity(self, entity_id: str) -> Dict[str, Any]:
         """
@@ -254,10 +281,12 @@ class Entity:
                 logging.error(f"Failed to get cached entity {entity_id}: {e}")
 
         if obj is None:
-            obj = await self.get(entity_id) 
+            obj = await self.get(entity_id)
             self.cache(entity_id, obj)
 
-        return self.dump_schema.model_validate(obj).model_dump(mode="json")
+        # Same trusted-dict shortcut as get_cached: narrow the key set to
+        # the dump schema without a Pydantic round trip.
+        return self._project_dump(obj)
 
     async def aget_entity(self, entity_id: str) -> Dict[str, Any]:
         identifier = self.get_identifier(entity_id)
@@ -2,7 +2,7 @@ import logging
 import logging.config
 import os
 
-_override = os.getenv("FASTAPI_DEBUG", "false").lower() in ["true", "1", "yes"]
+_override = os.getenv("FASTAPI_DEBUG", "false").lower() in {"true", "1", "yes"}
 
 
 def override_level(level: str):
@@ -1,6 +1,8 @@
+import asyncio
 import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from routers.generic import install_error_handler
 from contextlib import asynccontextmanager
 from sqlalchemy import text
@@ -94,6 +96,9 @@ class Config:
         self.settings["POSTGRES_MAX_OVERFLOW"] = int(
             os.getenv("POSTGRES_MAX_OVERFLOW", 20)
         )
+        self.settings["POSTGRES_STMT_CACHE_SIZE"] = int(
+            os.getenv("POSTGRES_STMT_CACHE_SIZE", 256)
+        )
 
 
 # Configure application settings
@@ -114,6 +119,13 @@ async def lifespan(app: FastAPI):
         await conn.execute(text("SELECT 1"))
     logger.info("Database connection OK")
 
+    # Pre-open the full pool so the first requests don't pay connection
+    # setup latency on a cold pool.
+    pool_size = int(config.settings.get("POSTGRES_POOL_SIZE", 10))
+    conns = await asyncio.gather(*(eng.connect() for _ in range(pool_size)))
+    await asyncio.gather(*(conn.close() for conn in conns))
+    logger.info("Connection pool pre-warmed (%d connections)", pool_size)
+
     # yield control to the application runtime
     yield
 
@@ -129,6 +141,9 @@ api = FastAPI(
     version="0.0.1",
     root_path=config.settings["CONTEXT_PATH"],
     lifespan=lifespan,
+    # orjson encodes response payloads in C; stdlib json dominated
+    # marshaling time on list-heavy endpoints.
+    default_response_class=ORJSONResponse,
 )
 
 api.add_middleware(
@@ -165,10 +180,15 @@ api.include_router(images_router)
 api.include_router(observability_router)
 
 if __name__ == "__main__":
-    # Run Uvicorn programmatically using the configuration
+    # Run Uvicorn programmatically using the configuration.
+    # Outside DEBUG, run one worker per CPU; workers are incompatible
+    # with --reload, so DEBUG keeps the single reloading process.
     uvicorn.run(
         "main:api",
         host=config.settings["HOST"],
         port=config.settings["PORT"],
         reload=config.settings["DEBUG"],
+        loop="uvloop",
+        http="httptools",
+        workers=None if config.settings["DEBUG"] else os.cpu_count(),
     )
@@ -52,17 +52,41 @@ def _redact(d: Dict[str, Any]) -> Dict[str, Any]:
             out[k] = v
     return out
 
-def _pick_request(args, kwargs, fn) -> Optional[Request]:
-    req = kwargs.get("request")
-    if isinstance(req, Request):
-        return req
-    sig = inspect.signature(fn)
-    bound = sig.bind_partial(*args, **kwargs)
-    for name, param in sig.parameters.items():
-        val = bound.arguments.get(name)
-        if isinstance(val, Request):
-            return val
-    return None
+def fast_update_dump(model: BaseModel) -> Dict[str, Any]:
+    """
+    Dump only the client-set fields of a flat update model.
+
+    Reading __pydantic_fields_set__ directly skips model_dump's alias
+    resolution, mode branching, and nested-model recursion. Only safe for
+    models whose fields are plain values (no nested BaseModel fields).
+    """
+    return {k: getattr(model, k) for k in model.__pydantic_fields_set__}
+
+
+def _request_finder(fn) -> Callable[[tuple, dict], Optional[Request]]:
+    """
+    Build a per-endpoint Request locator at decoration time.
+
+    The signature is inspected once when the route is registered; the
+    returned closure only does dict lookups and isinstance checks per
+    request instead of rebuilding and binding the signature each call.
+    """
+    param_names = tuple(inspect.signature(fn).parameters)
+
+    def find(args, kwargs) -> Optional[Request]:
+        req = kwargs.get("request")
+        if isinstance(req, Request):
+            return req
+        for val in args:
+            if isinstance(val, Request):
+                return val
+        for name in param_names:
+            val = kwargs.get(name)
+            if isinstance(val, Request):
+                return val
+        return None
+
+    return find
 
 # ---------- Decorator ----------
 def render(
@@ -83,10 +107,11 @@ def render(
 
     def decorator(func: EndpointFn) -> EndpointFn:
         is_coro = inspect.iscoroutinefunction(func)
+        find_request = _request_finder(func)
 
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
-            req = _pick_request(args, kwargs, func)
+            req = find_request(args, kwargs)
             if req is None:
                 raise RuntimeError(
                     "render(): endpoint must accept a 'request: Request' parameter "
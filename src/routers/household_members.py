@@ -2,13 +2,17 @@
 Household Member management endpoints (independent entity)
 """
 
+import asyncio
 from typing import Dict, Any
+import orjson
 from fastapi import APIRouter, Depends, Request
+from fastapi.responses import ORJSONResponse
+from starlette.responses import StreamingResponse
 import kutils
 import logging
-from auth import auth
+from auth import auth, current_user_id
 from exceptions import NotFoundError, AuthorizationError
-from routers.generic import render
+from routers.generic import fast_update_dump, render
 from schemas import (
     HouseholdMemberCreateWithHousehold,
     HouseholdMemberUpdate,
@@ -23,7 +27,9 @@ from routers.households import verify_access
 logger = logging.getLogger(__name__)
 
 router = APIRouter(
-    prefix="/api/v1/members", tags=["Household Members Management Operations"]
+    prefix="/api/v1/members",
+    tags=["Household Members Management Operations"],
+    default_response_class=ORJSONResponse,
 )
 
 # ========== Household Member Endpoints ==========
@@ -39,6 +45,7 @@ router = APIRouter(
 async def api_create_member(
     request: Request,
     member_data: HouseholdMemberCreateWithHousehold,
+    user_id: str = Depends(current_user_id),
 ):
     """
     Create a new household member.
@@ -47,13 +54,11 @@ async def api_create_member(
     # Verify access to household
     await verify_access(request, member_data.household_id)
 
-    user = kutils.current_user(request)
-
     # Create member
-    spec = member_data.model_dump()
-    member = await HOUSEHOLD_MEMBER.acreate_entity(spec, user)
+    spec = member_data.model_dump(exclude_unset=True)
+    member = await HOUSEHOLD_MEMBER.acreate_entity(spec, {"sub": user_id})
 
-    return HouseholdMemberResponse(**member)
+    return HouseholdMemberResponse.model_construct(**member)
 
 
 @router.get(
@@ -70,7 +75,7 @@ async def api_get_member(
     """Get household member details by ID. User must have access to the household."""
     member, _ = await verify_access(request, None, member_id)
 
-    return HouseholdMemberResponse(**member)
+    return HouseholdMemberResponse.model_construct(**member)
 
 
 @router.get(
@@ -88,14 +93,26 @@ async def api_list_members(
 ):
     """List all members of a household. User must have access to the household."""
 
-    await verify_access(request, household_id)
+    # Clients accepting NDJSON get rows streamed as they come off the DB,
+    # keeping peak memory at one batch and overlapping fetch with send.
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        await verify_access(request, household_id)
+
+        async def member_lines():
+            async for member in HOUSEHOLD_MEMBER.stream(
+                household_id, limit=limit, offset=offset
+            ):
+                yield orjson.dumps(member) + b"\n"
 
-    user = kutils.current_user(request)
+        return StreamingResponse(member_lines(), media_type="application/x-ndjson")
 
-    members = await HOUSEHOLD_MEMBER.fetch(
-        limit=limit, offset=offset, household_id=household_id
+    # Read-only path: the authz lookup and the member fetch are independent
+    # queries, so run them concurrently instead of back to back.
+    _, members = await asyncio.gather(
+        verify_access(request, household_id),
+        HOUSEHOLD_MEMBER.fetch(limit=limit, offset=offset, household_id=household_id),
     )
-    return [HouseholdMemberResponse(**m) for m in members]
+    return [HouseholdMemberResponse.model_construct(**m) for m in members]
 
 
 @router.patch(
@@ -117,7 +134,7 @@ async def api_patch_member(
     spec = member_data.model_dump(exclude_unset=True)
     updated_member = await HOUSEHOLD_MEMBER.patch(member_id, spec)
 
-    return HouseholdMemberResponse(**updated_member)
+    return HouseholdMemberResponse.model_construct(**updated_member)
 
 
 @router.delete(
@@ -162,7 +179,7 @@ async def api_create_member_profile(
     spec = profile_data.model_dump(exclude_unset=True)
     profile = await HOUSEHOLD_MEMBER.create_member_profile(member_id, spec)
 
-    return HouseholdMemberProfileResponse(**profile)
+    return HouseholdMemberProfileResponse.model_construct(**profile)
 
 
 @router.patch(
@@ -180,11 +197,11 @@ async def api_patch_member_profile(
     """Create or update a household member's profile. User must have access."""
     await verify_access(request, None, member_id)
 
-    # Create/update profile
-    spec = profile_data.model_dump(exclude_unset=True)
+    # Create/update profile (flat schema, so the field-set dump applies)
+    spec = fast_update_dump(profile_data)
     profile = await HOUSEHOLD_MEMBER.update_member_profile(member_id, spec)
 
-    return HouseholdMemberProfileResponse(**profile)
+    return HouseholdMemberProfileResponse.model_construct(**profile)
 
 
 @router.get(
@@ -197,16 +214,24 @@ async def api_patch_member_profile(
 async def api_get_member_profile(
     request: Request,
     member_id: str,
+    user_id: str = Depends(current_user_id),
 ):
     """Get a household member's profile. User must have access."""
-    await verify_access(request, None, member_id)
+    # Profile and household owner come back from a single joined query,
+    # replacing the member + household + profile fetch sequence.
+    profile, owner_id = await HOUSEHOLD_MEMBER.get_profile_with_owner(member_id)
+
+    if (
+        owner_id != user_id
+        and not kutils.is_admin(request)
+        and not kutils.is_agent(request)
+    ):
+        raise AuthorizationError(detail="You do not have access to this member")
 
-    # Get profile
-    profile = await HOUSEHOLD_MEMBER.get_member_profile(member_id)
     if not profile:
         raise NotFoundError(detail="Profile not found for this member")
 
-    return HouseholdMemberProfileResponse(**profile)
+    return HouseholdMemberProfileResponse.model_construct(**profile)
 
 
 @router.delete(
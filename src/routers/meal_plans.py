@@ -2,14 +2,15 @@
 Meal plan storage and retrieval endpoints scoped to household members.
 """
 
+import asyncio
 from datetime import date
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, Query, Request
 
 from auth import auth
 from routers.generic import render
-from routers.households import verify_access
+from routers.households import verified_member, verify_access
 from api.v1.meal_plans import MEAL_PLAN
 from schemas import MealPlanRevokeResponse, MealPlanResponse, MealPlanStoreRequest
 
@@ -31,17 +32,17 @@ async def api_store_meal_plan(
     request: Request,
     member_id: str,
     payload: MealPlanStoreRequest,
+    member: Dict[str, Any] = Depends(verified_member),
 ):
-    await verify_access(request, None, member_id)
-
     target_date = payload.date or date.today()
     created = await MEAL_PLAN.store_for_members(
         requested_member_id=member_id,
         target_date=target_date,
         meal_plan_spec=payload.meal_plan.model_dump(exclude_none=True),
         additional_member_ids=payload.applies_to_member_ids,
+        requested_member_household_id=member["household_id"],
     )
-    return MealPlanResponse(**created)
+    return MealPlanResponse.model_construct(**created)
 
 
 @router.get(
@@ -56,14 +57,17 @@ async def api_get_member_meal_plan(
     member_id: str,
     meal_date: Optional[date] = Query(default=None, alias="date"),
 ):
-    await verify_access(request, None, member_id)
-
     target_date = meal_date or date.today()
-    meal_plan = await MEAL_PLAN.get_for_member_and_date(
-        member_id=member_id,
-        target_date=target_date,
+    # Read-only path: authz and the plan lookup are independent queries,
+    # so run them concurrently instead of back to back.
+    _, meal_plan = await asyncio.gather(
+        verify_access(request, None, member_id),
+        MEAL_PLAN.get_for_member_and_date(
+            member_id=member_id,
+            target_date=target_date,
+        ),
     )
-    return MealPlanResponse(**meal_plan)
+    return MealPlanResponse.model_construct(**meal_plan)
 
 
 @router.delete(
@@ -81,12 +85,12 @@ async def api_revoke_member_meal_plan(
     member_id: str,
     meal_plan_id: str,
     revoke_for_all_members: bool = False,
+    member: Dict[str, Any] = Depends(verified_member),
 ):
-    await verify_access(request, None, member_id)
-
     revoked = await MEAL_PLAN.revoke(
         member_id=member_id,
         meal_plan_id=meal_plan_id,
         revoke_for_all_members=revoke_for_all_members,
+        member_household_id=member["household_id"],
     )
-    return MealPlanRevokeResponse(**revoked)
+    return MealPlanRevokeResponse.model_construct(**revoked)
@@ -7,9 +7,16 @@ Pydantic schemas for API request/response validation (no forward refs)
 
 from datetime import date as DateType, datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    Field,
+    ConfigDict,
+    field_validator,
+    model_validator,
+)
 
 
 # ------- System Schemas -------
@@ -120,16 +127,18 @@ class HouseholdMemberProfileResponse(HouseholdMemberProfileBase):
 
 
 # ---------- Household Member Schemas ----------
+# Normalized age group: strip/lower run as C builtins inside pydantic-core
+# instead of a Python classmethod frame per validation.
+AgeGroupField = Annotated[
+    AgeGroupEnum, BeforeValidator(str.lower), BeforeValidator(str.strip)
+]
+
+
 class HouseholdMemberBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=255)
-    age_group: AgeGroupEnum
+    age_group: AgeGroupField
     image_url: Optional[str] = None
 
-    @field_validator("age_group", mode="before")
-    @classmethod
-    def _norm_age_group(cls, v):
-        return v.strip().lower()
-
 class HouseholdMemberCreate(HouseholdMemberBase):
     profile: Optional[HouseholdMemberProfileCreate] = None
 
@@ -242,39 +251,15 @@ class GuidelineImportRequest(BaseModel):
     )
 
 
-class QAModeEnum(str, Enum):
-    simple = "simple"
-    advanced = "advanced"
-
-
-class QARetrieverEnum(str, Enum):
-    rag = "rag"
-    no_rag = "no_rag"
-    linearrag = "linearrag"
-
-
-class QAExpertiseLevelEnum(str, Enum):
-    beginner = "beginner"
-    intermediate = "intermediate"
-    expert = "expert"
-
-
-class QAPreferredAnswerEnum(str, Enum):
-    a = "a"
-    b = "b"
-    neither = "neither"
-    both = "both"
-
-
-class QAHelpfulnessEnum(str, Enum):
-    helpful = "helpful"
-    not_helpful = "not_helpful"
-
-
-class QATargetAnswerEnum(str, Enum):
-    primary = "primary"
-    secondary = "secondary"
-    overall = "overall"
+# QA option sets as Literal aliases: same wire values as the former str
+# enums, but validated through pydantic-core's literal fast path with no
+# Enum class construction at import.
+QAMode = Literal["simple", "advanced"]
+QARetriever = Literal["rag", "no_rag", "linearrag"]
+QAExpertiseLevel = Literal["beginner", "intermediate", "expert"]
+QAPreferredAnswer = Literal["a", "b", "neither", "both"]
+QAHelpfulness = Literal["helpful", "not_helpful"]
+QATargetAnswer = Literal["primary", "secondary", "overall"]
 
 
 class Reference(BaseModel):
@@ -328,8 +313,8 @@ class QARequest(BaseModel):
     question: str = Field(
         ..., min_length=3, max_length=1000, description="Food science question"
     )
-    mode: QAModeEnum = Field(
-        default=QAModeEnum.simple,
+    mode: QAMode = Field(
+        default="simple",
         description="simple = default pipeline, advanced = custom model/RAG settings",
     )
     model: Optional[str] = Field(default=None, description="Model (advanced mode only)")
@@ -337,12 +322,12 @@ class QARequest(BaseModel):
         default=True, description="Enable retrieval in advanced mode"
     )
     top_k: int = Field(default=5, ge=1, le=20, description="Retrieved article count")
-    retriever: QARetrieverEnum = Field(
-        default=QARetrieverEnum.rag,
+    retriever: QARetriever = Field(
+        default="rag",
         description="Retriever backend to use: rag, no_rag, or linearrag",
     )
-    expertise_level: QAExpertiseLevelEnum = Field(
-        default=QAExpertiseLevelEnum.intermediate,
+    expertise_level: QAExpertiseLevel = Field(
+        default="intermediate",
         description="Answer complexity level",
     )
     language: str = Field(default="en", description="ISO 639-1 language code")
@@ -365,22 +350,22 @@ class QARequest(BaseModel):
 
 class QAFeedbackRequest(BaseModel):
     request_id: str = Field(..., description="QA request identifier")
-    preferred_answer: Optional[QAPreferredAnswerEnum] = Field(
+    preferred_answer: Optional[QAPreferredAnswer] = Field(
         default=None,
         description=(
             "Dual-answer preference (A/B feedback only). Use when both primary "
             "and secondary answers are shown."
         ),
     )
-    helpfulness: Optional[QAHelpfulnessEnum] = Field(
+    helpfulness: Optional[QAHelpfulness] = Field(
         default=None,
         description=(
             "General helpfulness feedback. Use for single-answer or overall "
             "quality feedback."
         ),
     )
-    target_answer: QATargetAnswerEnum = Field(
-        default=QATargetAnswerEnum.overall,
+    target_answer: QATargetAnswer = Field(
+        default="overall",
         description="Which answer the feedback targets.",
     )
     reason: Optional[str] = Field(
@@ -404,7 +389,7 @@ class QAFeedbackResponse(BaseModel):
 
 class QAResponse(BaseModel):
     question: str = Field(..., description="Original question")
-    mode: QAModeEnum = Field(..., description="Mode used")
+    mode: QAMode = Field(..., description="Mode used")
     primary_answer: QAAnswer = Field(..., description="Primary answer")
     secondary_answer: Optional[QAAnswer] = Field(
         default=None, description="Secondary answer for A/B comparison"
@@ -418,7 +403,7 @@ class QAResponse(BaseModel):
     follow_up_suggestions: Optional[List[str]] = Field(
         default=None, description="Suggested follow-up questions"
     )
-    generated_at: str = Field(..., description="ISO response generation timestamp")
+    generated_at: datetime = Field(..., description="Response generation timestamp")
     cache_hit: bool = Field(default=False, description="Whether result came from cache")
     request_id: str = Field(..., description="Unique request identifier")
 
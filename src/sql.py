@@ -2,7 +2,6 @@
 SQLAlchemy models and database access methods for WiseFood API
 """
 from __future__ import annotations
-from sqlalchemy import inspect as sa_inspect
 from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import uuid4
@@ -20,6 +19,8 @@ from sqlalchemy import (
     UniqueConstraint,
     select,
     delete,
+    func,
+    text,
     Enum,
     ARRAY,
 )
@@ -84,6 +85,27 @@ class DietaryGroup(str, enum.Enum):
     mediterranean = "mediterranean"
 
 
+# Precomputed value -> member map; coercion loops over incoming dietary
+# group lists hit a plain dict instead of the Enum __call__ machinery.
+DIETARY_GROUP_BY_VALUE = {m.value: m for m in DietaryGroup}
+
+# Reverse maps for serialization: .value on an enum member resolves a
+# DynamicClassAttribute descriptor per access, so to_dict loops read
+# these dicts instead (str-enum members hash as their value, so raw
+# strings from the driver also hit).
+_AGE_GROUP_STR = {m: m.value for m in AgeGroup}
+_DIETARY_GROUP_STR = {m: m.value for m in DietaryGroup}
+
+
+def coerce_dietary_groups(values: Optional[List]) -> List[DietaryGroup]:
+    """Coerce a list of raw dietary-group values (str or enum) to enum members."""
+    if not values:
+        return []
+    return [
+        DIETARY_GROUP_BY_VALUE[v] if isinstance(v, str) else v for v in values
+    ]
+
+
 # ---------- SQLAlchemy Models ----------
 
 class Household(Base):
@@ -100,38 +122,62 @@ class Household(Base):
     __tablename__ = "household"
     __table_args__ = {"schema": "wisefood"}
 
-    id = mapped_column(String(64), primary_key=True, default=lambda: str(uuid4()))
+    # Internal IDs are native uuid columns (16-byte storage and binary
+    # transport, half the index width of varchar(64)); as_uuid=False keeps
+    # them plain strings on the Python side, matching the entity dicts,
+    # caches, and path params. owner_id stays a string: it is an external
+    # Keycloak identifier, not ours to retype.
+    id = mapped_column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4()))
     name = mapped_column(String(255), nullable=False)
     region = mapped_column(String(100), nullable=True)
     owner_id = mapped_column(String(100), nullable=False, index=True)
-    created_at = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
-    updated_at = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
-    metadata_ = mapped_column("metadata", JSONB, nullable=True, default=dict)
+    created_at = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=func.now(), nullable=False)
+    updated_at = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), server_default=func.now(), nullable=False)
+    # JSONB/array defaults are server-side ('{}' in the init DDL too), so
+    # inserts that omit them send no bytes for the column; readers guard
+    # with `or {}` / `or []` since unrefreshed attributes stay None.
+    metadata_ = mapped_column(
+        "metadata", JSONB, nullable=True, server_default=text("'{}'::jsonb")
+    )
 
     # Relationships
+    # lazy="raise_on_sql": collections must be eager-loaded explicitly
+    # (selectinload); an accidental lazy load fails loudly instead of
+    # firing an N+1 query (or a MissingGreenlet under async).
     members: Mapped[List["HouseholdMember"]] = relationship(
-        "HouseholdMember", back_populates="household", cascade="all, delete-orphan"
+        "HouseholdMember",
+        back_populates="household",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     meal_plans: Mapped[List["MealPlan"]] = relationship(
-        "MealPlan", back_populates="household", cascade="all, delete-orphan"
+        "MealPlan",
+        back_populates="household",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
+    # to_dict leaves datetime/date values as objects: orjson (the Redis
+    # cache and every response path) encodes them to ISO-8601 in C, so
+    # pre-rendering strings here just allocated per-row garbage.
     def to_dict(self, include_members: bool = False) -> dict:
         result = {
             "id": self.id,
             "name": self.name,
             "region": self.region,
             "owner_id": self.owner_id,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
             "metadata": self.metadata_ or {},
         }
 
-        insp = sa_inspect(self)
-
-        # Only include members if requested AND already loaded
+        # Only include members if requested AND already loaded. Realized
+        # relationships live in the instance __dict__, so a membership
+        # probe replaces the sa_inspect() state walk per row.
         if include_members:
-            if "members" not in insp.unloaded:
+            if "members" in self.__dict__:
                 members = [m.to_dict(include_profile=True) for m in self.members]
                 result["members"] = members
                 result["member_count"] = len(members)
@@ -153,22 +199,34 @@ class HouseholdMember(Base):
     Only the household owner has a Keycloak user account.
     """
     __tablename__ = "household_member"
-    __table_args__ = {"schema": "wisefood"}
+    __table_args__ = (
+        Index("ix_household_member_household_id_id", "household_id", "id"),
+        {"schema": "wisefood"},
+    )
 
-    id = mapped_column(String(64), primary_key=True, default=lambda: str(uuid4()))
+    id = mapped_column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4()))
     name = mapped_column(String(255), nullable=False)
     image_url = mapped_column(Text, nullable=True)
     age_group = mapped_column(Enum(AgeGroup, name="age_groups", create_type=False), nullable=False)
-    household_id = mapped_column(String(100), ForeignKey("wisefood.household.id", ondelete="CASCADE", onupdate="CASCADE"), nullable=False, index=True)
-    joined_at = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    household_id = mapped_column(UUID(as_uuid=False), ForeignKey("wisefood.household.id", ondelete="CASCADE", onupdate="CASCADE"), nullable=False, index=True)
+    joined_at = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=func.now(), nullable=False)
 
     # Relationships
     household: Mapped["Household"] = relationship("Household", back_populates="members")
     profile: Mapped[Optional["HouseholdMemberProfile"]] = relationship(
-        "HouseholdMemberProfile", back_populates="member", cascade="all, delete-orphan", uselist=False
+        "HouseholdMemberProfile",
+        back_populates="member",
+        cascade="all, delete-orphan",
+        uselist=False,
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     meal_plan_assignments: Mapped[List["MealPlanMember"]] = relationship(
-        "MealPlanMember", back_populates="member", cascade="all, delete-orphan"
+        "MealPlanMember",
+        back_populates="member",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     def to_dict(self, include_profile: bool = False) -> dict:
@@ -176,13 +234,12 @@ class HouseholdMember(Base):
             "id": self.id,
             "name": self.name,
             "image_url": self.image_url,
-            "age_group": self.age_group.value if self.age_group else None,
+            "age_group": _AGE_GROUP_STR.get(self.age_group),
             "household_id": self.household_id,
-            "joined_at": self.joined_at.isoformat(),
+            "joined_at": self.joined_at,
         }
         if include_profile:
-            insp = sa_inspect(self)
-            if "profile" not in insp.unloaded and self.profile:
+            if "profile" in self.__dict__ and self.profile:
                 result["profile"] = self.profile.to_dict()
             # else: do not touch relationship; avoid triggering IO
         return result
@@ -195,20 +252,22 @@ class HouseholdMemberProfile(Base):
     __tablename__ = "household_member_profile"
     __table_args__ = {"schema": "wisefood"}
 
-    id = mapped_column(String(64), primary_key=True, default=lambda: str(uuid4()))
+    id = mapped_column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4()))
     household_member_id = mapped_column(
-        String(100),
+        UUID(as_uuid=False),
         ForeignKey("wisefood.household_member.id", ondelete="CASCADE", onupdate="CASCADE"),
         nullable=False,
         unique=True,
         index=True
     )
-    nutritional_preferences = mapped_column(JSONB, nullable=True, default=dict)
-    dietary_groups = mapped_column(ARRAY(Enum(DietaryGroup, name="dietary_groups", create_type=False)), nullable=True, default=list)
-    allergies = mapped_column(ARRAY(String), nullable=True, default=list)
-    properties = mapped_column(JSONB, nullable=True, default=dict)
-    created_at = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
-    updated_at = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
+    nutritional_preferences = mapped_column(
+        JSONB, nullable=True, server_default=text("'{}'::jsonb")
+    )
+    dietary_groups = mapped_column(ARRAY(Enum(DietaryGroup, name="dietary_groups", create_type=False)), nullable=True, server_default=text("'{}'"))
+    allergies = mapped_column(ARRAY(String), nullable=True, server_default=text("'{}'"))
+    properties = mapped_column(JSONB, nullable=True, server_default=text("'{}'::jsonb"))
+    created_at = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=func.now(), nullable=False)
+    updated_at = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), server_default=func.now(), nullable=False)
 
     # Relationships
     member: Mapped["HouseholdMember"] = relationship("HouseholdMember", back_populates="profile")
@@ -218,11 +277,11 @@ class HouseholdMemberProfile(Base):
             "id": self.id,
             "household_member_id": self.household_member_id,
             "nutritional_preferences": self.nutritional_preferences or {},
-            "dietary_groups": [dg.value for dg in (self.dietary_groups or [])],
+            "dietary_groups": [_DIETARY_GROUP_STR[dg] for dg in (self.dietary_groups or [])],
             "allergies": self.allergies or [],
             "properties": self.properties or {},
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
 
@@ -235,33 +294,40 @@ class MealPlan(Base):
 
     __tablename__ = "meal_plan"
     __table_args__ = (
-        Index("ix_meal_plan_household_id", "household_id"),
-        Index("ix_meal_plan_applied_on", "applied_on"),
+        # Plan lookups always scope by household and date together, so one
+        # composite index serves the (household_id, applied_on) predicates
+        # and the household-only prefix.
+        Index("ix_meal_plan_household_id_applied_on", "household_id", "applied_on"),
         {"schema": "wisefood"},
     )
 
-    id = mapped_column(String(64), primary_key=True, default=lambda: str(uuid4()))
+    id = mapped_column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4()))
     household_id = mapped_column(
-        String(100),
+        UUID(as_uuid=False),
         ForeignKey("wisefood.household.id", ondelete="CASCADE", onupdate="CASCADE"),
         nullable=False,
     )
     applied_on = mapped_column(Date, nullable=False)
     source_meal_plan_id = mapped_column(String(100), nullable=True)
     source_created_at = mapped_column(DateTime(timezone=True), nullable=True)
-    breakfast = mapped_column(JSONB, nullable=False, default=dict)
-    lunch = mapped_column(JSONB, nullable=False, default=dict)
-    dinner = mapped_column(JSONB, nullable=False, default=dict)
+    breakfast = mapped_column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    lunch = mapped_column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    dinner = mapped_column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
     reasoning = mapped_column(Text, nullable=True)
     created_at = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
 
     household: Mapped["Household"] = relationship("Household", back_populates="meal_plans")
     assignments: Mapped[List["MealPlanMember"]] = relationship(
-        "MealPlanMember", back_populates="meal_plan", cascade="all, delete-orphan"
+        "MealPlanMember",
+        back_populates="meal_plan",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     def to_dict(
@@ -272,25 +338,26 @@ class MealPlan(Base):
         result = {
             "id": self.id,
             "household_id": self.household_id,
-            "date": self.applied_on.isoformat(),
+            "date": self.applied_on,
             "source_meal_plan_id": self.source_meal_plan_id,
-            "source_created_at": self.source_created_at.isoformat() if self.source_created_at else None,
+            "source_created_at": self.source_created_at,
             "breakfast": self.breakfast or {},
             "lunch": self.lunch or {},
             "dinner": self.dinner or {},
             "reasoning": self.reasoning,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self.created_at,
         }
 
-        member_ids: List[str] = []
         if include_member_ids:
-            insp = sa_inspect(self)
-            if "assignments" not in insp.unloaded:
-                member_ids = sorted([a.member_id for a in self.assignments])
+            member_ids: List[str] = []
+            if "assignments" in self.__dict__:
+                member_ids = [a.member_id for a in self.assignments]
+                member_ids.sort()
             result["applies_to_member_ids"] = member_ids
             if current_member_id:
                 result["other_member_ids"] = [mid for mid in member_ids if mid != current_member_id]
             else:
+                # Same list object; callers treat these as read-only.
                 result["other_member_ids"] = member_ids
 
         return result
@@ -308,21 +375,22 @@ class MealPlanMember(Base):
         {"schema": "wisefood"},
     )
 
-    id = mapped_column(String(64), primary_key=True, default=lambda: str(uuid4()))
+    id = mapped_column(UUID(as_uuid=False), primary_key=True, default=lambda: str(uuid4()))
     meal_plan_id = mapped_column(
-        String(64),
+        UUID(as_uuid=False),
         ForeignKey("wisefood.meal_plan.id", ondelete="CASCADE", onupdate="CASCADE"),
         nullable=False,
         index=True,
     )
     member_id = mapped_column(
-        String(100),
+        UUID(as_uuid=False),
         ForeignKey("wisefood.household_member.id", ondelete="CASCADE", onupdate="CASCADE"),
         nullable=False,
     )
     created_at = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
 
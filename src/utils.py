@@ -1,5 +1,12 @@
 import re
-import uuid
+
+_URL_RE = re.compile(r"^(s3|https|http|tcp|smb|ftp)://[a-zA-Z0-9.-]+(?:/[^\s]*)?$")
+
+# Canonical UUID form (lowercase hex, hyphenated) — the same shape the
+# old uuid.UUID round trip accepted, without exception-driven rejects.
+_UUID_RE = re.compile(
+    r"\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z"
+)
 
 
 def is_valid_url(url):
@@ -9,8 +16,7 @@ def is_valid_url(url):
     Returns:
         A boolean value indicating whether the string is a valid
     """
-    pattern = re.compile(r"^(s3|https|http|tcp|smb|ftp)://[a-zA-Z0-9.-]+(?:/[^\s]*)?$")
-    return bool(pattern.match(url))
+    return _URL_RE.match(url) is not None
 
 
 def is_valid_uuid(s):
@@ -20,10 +26,4 @@ def is_valid_uuid(s):
     Returns:
         A boolean value indicating whether the string is a valid UUID.
     """
-    try:
-        # Try converting the string to a UUID object
-        uuid_obj = uuid.UUID(s)
-        # Check if the string matches the canonical form of the UUID (with lowercase hexadecimal and hyphens)
-        return str(uuid_obj) == s
-    except Exception:
-        return False
\ No newline at end of file
+    return isinstance(s, str) and _UUID_RE.match(s) is not None
\ No newline at end of file